@@ -1,36 +1,66 @@
+import csv
 import pandas as pd
-import json
-import random
+import numpy as np
+import orjson
 import math
+from collections import defaultdict
 
-random.seed(42)
+rng = np.random.default_rng(42)
 
 # ── Highways with REAL maha.xlsx data ──
 MAHA_HIGHWAYS = ['NH48', 'NH60', 'NH65', 'NH160']
 
+maha_columns = [
+    'road_id', 'name', 'segment_start_km', 'segment_end_km',
+    'jurisdiction', 'category', 'length_km', 'lane_count', 'surface_type',
+    'year_constructed', 'last_major_rehab_year', 'status',
+    'state', 'district', 'taluka', 'region_type', 'terrain_type',
+    'slope_category', 'monsoon_rainfall_category',
+    'landslide_prone', 'flood_prone', 'ghat_section_flag', 'tourism_route_flag',
+    'elevation_m', 'avg_daily_traffic', 'truck_percentage',
+    'peak_hour_traffic', 'traffic_weight', 'seasonal_variation'
+]
+
+# Explicit dtypes so pandas skips object-dtype inference on load
+MAHA_DTYPES = {
+    'year_constructed': 'Int32',
+    'last_major_rehab_year': 'Int32',
+    'lane_count': 'Int16',
+    'avg_daily_traffic': 'Int32',
+    'peak_hour_traffic': 'Int32',
+    'segment_start_km': 'float64',
+    'segment_end_km': 'float64',
+    'length_km': 'float64',
+    'elevation_m': 'float64',
+    'truck_percentage': 'float64',
+    'traffic_weight': 'float64',
+}
+
 # Read the NH.geojson file
 print("Reading NH.geojson...")
-with open('NH.geojson', 'r', encoding='utf-8') as f:
-    geojson_data = json.load(f)
+with open('NH.geojson', 'rb') as f:
+    geojson_data = orjson.loads(f.read())
 print(f"Total features in GeoJSON: {len(geojson_data['features'])}")
 
 # Read the maha.xlsx file
 print("Reading maha.xlsx...")
-maha_df = pd.read_excel('maha.xlsx')
+maha_df = pd.read_excel(
+    'maha.xlsx',
+    usecols=['nh_number'] + maha_columns,
+    dtype=MAHA_DTYPES,
+    engine='openpyxl',
+)
 maha_df = maha_df[maha_df['nh_number'].isin(MAHA_HIGHWAYS)].reset_index(drop=True)
 print(f"maha.xlsx rows (after filtering SH roads): {len(maha_df)}")
 
 # ── Collect ALL highway refs from GeoJSON ──
 # For compound refs like "NH48;NH166", assign to PRIMARY (first) ref
-highway_features = {}
+highway_features = defaultdict(list)
 for feature in geojson_data['features']:
     ref = feature['properties'].get('ref', '')
     if not ref:
         continue
-    primary_ref = ref.split(';')[0].strip()
-    if primary_ref not in highway_features:
-        highway_features[primary_ref] = []
-    highway_features[primary_ref].append(feature)
+    highway_features[ref.split(';', 1)[0].strip()].append(feature)
 
 all_highway_names = sorted(highway_features.keys())
 print(f"\nFound {len(all_highway_names)} unique primary highway refs in GeoJSON")
@@ -43,35 +73,31 @@ for nh in MAHA_HIGHWAYS:
     maha_by_nh[nh] = maha_df[maha_df['nh_number'] == nh].reset_index(drop=True)
 
 # ── Gather all real districts/talukas for synthetic pool ──
-all_districts = maha_df['district'].dropna().unique().tolist()
-all_talukas = maha_df['taluka'].dropna().unique().tolist()
+all_districts = maha_df['district'].dropna().unique()
+all_talukas = maha_df['taluka'].dropna().unique()
 
 districts_by_nh = {}
 talukas_by_nh = {}
 for nh in MAHA_HIGHWAYS:
     sub = maha_by_nh[nh]
-    districts_by_nh[nh] = sub['district'].dropna().tolist()
-    talukas_by_nh[nh] = sub['taluka'].dropna().tolist()
-
-jurisdictions = ['State PWD', 'NHAI', 'Municipality', 'PMGSY']
-categories = ['Inter-State', 'State', 'Urban', 'National']
-surface_types = ['earthen', 'gravel', 'bitumen', 'concrete']
-statuses = ['active', 'under_construction']
-region_types = ['coastal', 'urban_corridor', 'plateau', 'ghat', 'plain']
-terrain_types = ['hilly', 'plain', 'steep']
-slope_categories = ['moderate', 'flat', 'steep']
-rainfall_categories = ['high', 'medium', 'low']
-
-maha_columns = [
-    'road_id', 'name', 'segment_start_km', 'segment_end_km',
-    'jurisdiction', 'category', 'length_km', 'lane_count', 'surface_type',
-    'year_constructed', 'last_major_rehab_year', 'status',
-    'state', 'district', 'taluka', 'region_type', 'terrain_type',
-    'slope_category', 'monsoon_rainfall_category',
-    'landslide_prone', 'flood_prone', 'ghat_section_flag', 'tourism_route_flag',
-    'elevation_m', 'avg_daily_traffic', 'truck_percentage',
-    'peak_hour_traffic', 'traffic_weight', 'seasonal_variation'
-]
+    districts_by_nh[nh] = sub['district'].dropna().to_numpy()
+    talukas_by_nh[nh] = sub['taluka'].dropna().to_numpy()
+
+# Category pools kept as numpy object arrays so rng.choice doesn't rebuild
+# an array from the Python list on every batched draw
+jurisdictions = np.asarray(['State PWD', 'NHAI', 'Municipality', 'PMGSY'], dtype=object)
+categories = np.asarray(['Inter-State', 'State', 'Urban', 'National'], dtype=object)
+surface_types = np.asarray(['earthen', 'gravel', 'bitumen', 'concrete'], dtype=object)
+region_types = np.asarray(['coastal', 'urban_corridor', 'plateau', 'ghat', 'plain'], dtype=object)
+terrain_types = np.asarray(['hilly', 'plain', 'steep'], dtype=object)
+slope_categories = np.asarray(['moderate', 'flat', 'steep'], dtype=object)
+rainfall_categories = np.asarray(['high', 'medium', 'low'], dtype=object)
+lane_pool = np.array([2, 2, 4, 4, 6])
+traffic_weight_pool = np.array([0.5, 1.0, 1.5, 2.0])
+
+# Seasonal variation always has the same 12-key shape; a %-format template
+# skips the per-row dict build and json encoder
+MONTH_TEMPLATE = '{' + ', '.join(f'"M{m}": %.2f' for m in range(1, 13)) + '}'
 
 # ── Surface Defect + Roughness columns (NEW) ──
 surface_defect_columns = [
@@ -132,78 +158,175 @@ DEFECT_RANGES = {
 }
 
 
-def generate_surface_defect_data(condition):
-    """Generate surface defect and roughness values based on road condition."""
-    ranges = DEFECT_RANGES[condition]
-    data = {}
-    for col in surface_defect_columns:
-        lo, hi = ranges[col]
-        if isinstance(lo, int) and isinstance(hi, int):
-            data[col] = random.randint(lo, hi)
-        else:
-            data[col] = round(random.uniform(lo, hi), 1)
-    return data
-
-
-def generate_synthetic_maha_row(nh, seg_idx):
-    """Generate realistic synthetic data matching maha.xlsx structure."""
-    seg_start = round(random.uniform(0.1, 199.8), 1)
-    seg_length = round(random.uniform(5.0, 25.0), 1)
-    year_built = random.randint(1998, 2022)
-    has_rehab = random.random() > 0.4
-    lane = random.choice([2, 2, 4, 4, 6])
-    terrain = random.choice(terrain_types)
-    is_ghat = terrain == 'steep' or random.random() < 0.3
-    is_hilly = terrain in ['hilly', 'steep']
-
-    months = {}
-    for m in range(1, 13):
-        months[f"M{m}"] = round(random.uniform(0.75, 1.25), 2)
+# Ranges stacked into parallel (condition, column) arrays so defect values
+# can be drawn for whole batches of segments at once
+CONDITIONS = ('good', 'average', 'very_bad')
+_COND_IDX = {c: i for i, c in enumerate(CONDITIONS)}
+_DEFECT_LO = np.array([[DEFECT_RANGES[c][col][0] for col in surface_defect_columns]
+                       for c in CONDITIONS], dtype=np.float64)
+_DEFECT_HI = np.array([[DEFECT_RANGES[c][col][1] for col in surface_defect_columns]
+                       for c in CONDITIONS], dtype=np.float64)
+_DEFECT_IS_INT = np.array([isinstance(DEFECT_RANGES['good'][col][0], int)
+                           for col in surface_defect_columns])
+
+
+def generate_surface_defect_batch(condition, n):
+    """Generate surface defect and roughness values for n segments of one
+    condition — one vectorized draw per column group instead of 11
+    random.* calls per segment."""
+    ci = _COND_IDX[condition]
+    lo, hi = _DEFECT_LO[ci], _DEFECT_HI[ci]
+    is_int = _DEFECT_IS_INT
+    vals = np.empty((n, len(surface_defect_columns)))
+    vals[:, is_int] = rng.integers(lo[is_int].astype(np.int64),
+                                   hi[is_int].astype(np.int64) + 1,
+                                   size=(n, int(is_int.sum())))
+    vals[:, ~is_int] = rng.uniform(lo[~is_int], hi[~is_int],
+                                   size=(n, int((~is_int).sum()))).round(1)
+    return vals
+
+
+def generate_synthetic_maha_rows(nh, start_seg_idx, n):
+    """Generate n realistic synthetic rows matching maha.xlsx structure.
+
+    All random draws are batched through numpy (one C-level call per column
+    instead of ~30 interpreter calls per row), then zipped into dicts.
+    """
+    if n <= 0:
+        return []
+
+    seg_start = rng.uniform(0.1, 199.8, size=n).round(1)
+    seg_length = rng.uniform(5.0, 25.0, size=n).round(1)
+    year_built = rng.integers(1998, 2023, size=n)
+    has_rehab = rng.random(n) > 0.4
+    rehab_year = rng.integers(2008, 2024, size=n)
+    lane = rng.choice(lane_pool, size=n)
+    terrain = rng.choice(terrain_types, size=n)
+    is_ghat = (terrain == 'steep') | (rng.random(n) < 0.3)
+    is_hilly = (terrain == 'hilly') | (terrain == 'steep')
+    landslide = is_hilly & (rng.random(n) < 0.45)
+    flood = ~is_hilly & (rng.random(n) < 0.2)
+    tourism = rng.random(n) < 0.45
+    slope = np.where(terrain == 'steep', 'steep',
+                     rng.choice(slope_categories, size=n))
+
+    jurisdiction = rng.choice(jurisdictions, size=n)
+    category = rng.choice(categories, size=n)
+    surface = rng.choice(surface_types, size=n)
+    status = np.where(rng.random(n) < 0.85, 'active', 'under_construction')
+    region = rng.choice(region_types, size=n)
+    rainfall = rng.choice(rainfall_categories, size=n)
 
     district_pool = districts_by_nh.get(nh, all_districts)
     taluka_pool = talukas_by_nh.get(nh, all_talukas)
-
-    return {
-        'road_id': f"MA-{nh}-SEG-{seg_idx:04d}",
-        'name': f"{nh} Segment {seg_idx}",
-        'segment_start_km': seg_start,
-        'segment_end_km': round(seg_start + seg_length, 1),
-        'jurisdiction': random.choice(jurisdictions),
-        'category': random.choice(categories),
-        'length_km': seg_length,
-        'lane_count': lane,
-        'surface_type': random.choice(surface_types),
-        'year_constructed': year_built,
-        'last_major_rehab_year': random.randint(2008, 2023) if has_rehab else None,
-        'status': random.choices(statuses, weights=[0.85, 0.15])[0],
-        'state': 'Maharashtra',
-        'district': random.choice(district_pool),
-        'taluka': random.choice(taluka_pool),
-        'region_type': random.choice(region_types),
-        'terrain_type': terrain,
-        'slope_category': 'steep' if terrain == 'steep' else random.choice(slope_categories),
-        'monsoon_rainfall_category': random.choice(rainfall_categories),
-        'landslide_prone': is_hilly and random.random() < 0.45,
-        'flood_prone': not is_hilly and random.random() < 0.2,
-        'ghat_section_flag': is_ghat,
-        'tourism_route_flag': random.random() < 0.45,
-        'elevation_m': round(random.uniform(0.8, 1189.1), 1),
-        'avg_daily_traffic': random.randint(2007, 29389),
-        'truck_percentage': round(random.uniform(10.1, 45.0), 1),
-        'peak_hour_traffic': random.randint(132, 3368),
-        'traffic_weight': round(random.choice([0.5, 1.0, 1.5, 2.0]), 1),
-        'seasonal_variation': json.dumps(months),
-    }
+    district = rng.choice(district_pool, size=n)
+    taluka = rng.choice(taluka_pool, size=n)
+
+    elevation = rng.uniform(0.8, 1189.1, size=n).round(1)
+    adt = rng.integers(2007, 29390, size=n)
+    truck_pct = rng.uniform(10.1, 45.0, size=n).round(1)
+    peak_traffic = rng.integers(132, 3369, size=n)
+    traffic_wt = rng.choice(traffic_weight_pool, size=n)
+
+    months = rng.uniform(0.75, 1.25, size=(n, 12)).round(2)
+    seasonal = [MONTH_TEMPLATE % tuple(row) for row in months]
+
+    rows = []
+    for i in range(n):
+        seg_idx = start_seg_idx + i
+        rows.append({
+            'road_id': f"MA-{nh}-SEG-{seg_idx:04d}",
+            'name': f"{nh} Segment {seg_idx}",
+            'segment_start_km': float(seg_start[i]),
+            'segment_end_km': round(float(seg_start[i]) + float(seg_length[i]), 1),
+            'jurisdiction': jurisdiction[i],
+            'category': category[i],
+            'length_km': float(seg_length[i]),
+            'lane_count': int(lane[i]),
+            'surface_type': surface[i],
+            'year_constructed': int(year_built[i]),
+            'last_major_rehab_year': int(rehab_year[i]) if has_rehab[i] else None,
+            'status': status[i],
+            'state': 'Maharashtra',
+            'district': district[i],
+            'taluka': taluka[i],
+            'region_type': region[i],
+            'terrain_type': terrain[i],
+            'slope_category': slope[i],
+            'monsoon_rainfall_category': rainfall[i],
+            'landslide_prone': bool(landslide[i]),
+            'flood_prone': bool(flood[i]),
+            'ghat_section_flag': bool(is_ghat[i]),
+            'tourism_route_flag': bool(tourism[i]),
+            'elevation_m': float(elevation[i]),
+            'avg_daily_traffic': int(adt[i]),
+            'truck_percentage': float(truck_pct[i]),
+            'peak_hour_traffic': int(peak_traffic[i]),
+            'traffic_weight': float(traffic_wt[i]),
+            'seasonal_variation': seasonal[i],
+        })
+    return rows
 
 
 # ── Process ALL highways ──
-all_road_segments = []
+# CSV rows are streamed out and the per-highway JSON mapping is built
+# directly from the segment dicts — no intermediate DataFrame.
 highway_stats = {}
+json_mapping = {}
+total_segments = 0
+
+csv_fieldnames = [
+    'geojson_id', 'highway_ref', 'segment_number', 'condition',
+    'start_lat', 'start_lon', 'end_lat', 'end_lon',
+    'highway_type', 'oneway', 'lanes', 'maxspeed',
+] + maha_columns + surface_defect_columns
+
+output_file = 'all_highways_segments_conditions.csv'
+csv_fh = open(output_file, 'w', newline='', encoding='utf-8')
+csv_writer = csv.DictWriter(csv_fh, fieldnames=csv_fieldnames)
+csv_writer.writeheader()
+
+
+def _endpoints(coords):
+    """Extract (start_lon, start_lat, end_lon, end_lat) from a coordinate list.
+
+    Single try/except instead of four per-field len() guards in the hot loop.
+    """
+    try:
+        (sx, sy), (ex, ey) = coords[0][:2], coords[-1][:2]
+        return sx, sy, ex, ey
+    except (IndexError, TypeError, ValueError):
+        return 0, 0, 0, 0
+
+
+def build_json_entry(segment_data):
+    """Sanitize one segment dict into its JSON-mapping entry."""
+    entry = {
+        'segment_number': int(segment_data['segment_number']),
+        'condition': segment_data['condition'],
+        'coordinates': [
+            [segment_data['start_lon'], segment_data['start_lat']],
+            [segment_data['end_lon'], segment_data['end_lat']],
+        ],
+    }
+    for col in maha_columns + surface_defect_columns:
+        val = segment_data.get(col)
+        if val is None or (isinstance(val, float) and math.isnan(val)):
+            entry[col] = None
+        elif isinstance(val, bool):
+            entry[col] = bool(val)
+        elif isinstance(val, (int, float)):
+            entry[col] = val
+        else:
+            entry[col] = str(val)
+    return entry
+
 
 print(f"\nProcessing {len(all_highway_names)} highways...\n")
 
 for nh in all_highway_names:
     features = highway_features[nh]
+    json_mapping[nh] = {}
     maha_rows = maha_by_nh.get(nh)
     has_real_data = maha_rows is not None and len(maha_rows) > 0
     num_maha = len(maha_rows) if has_real_data else 0
@@ -212,25 +335,50 @@ for nh in all_highway_names:
     used_real = 0
     used_synthetic = 0
 
+    # Pre-generate all synthetic rows this highway will need in one batch
+    num_synth = max(0, len(features) - num_maha)
+    synthetic_rows = generate_synthetic_maha_rows(nh, num_maha + 1, num_synth)
+
+    # Draw every segment's condition up front, then generate defect values
+    # per condition group in one vectorized batch each
+    conditions = rng.choice(CONDITIONS, size=len(features))
+    defect_rows = np.empty((len(features), len(surface_defect_columns)))
+    for cond in CONDITIONS:
+        mask = conditions == cond
+        count = int(mask.sum())
+        if count:
+            defect_rows[mask] = generate_surface_defect_batch(cond, count)
+
+    # One vectorized NaN→None sweep + dict conversion instead of per-cell
+    # iloc access inside the feature loop
+    if has_real_data:
+        real_records = (
+            maha_rows[maha_columns]
+            .astype(object)
+            .where(maha_rows[maha_columns].notna(), None)
+            .to_dict(orient='records')
+        )
+    else:
+        real_records = []
+
     for idx, feature in enumerate(features):
         feature_id = feature.get('id', f'{nh}_segment_{idx}')
 
-        condition = random.choice(['good', 'average', 'very_bad'])
+        condition = str(conditions[idx])
         segment_conditions[condition] += 1
 
-        coords = feature['geometry']['coordinates']
-        start_coord = coords[0] if coords else [0, 0]
-        end_coord = coords[-1] if coords else [0, 0]
+        start_lon, start_lat, end_lon, end_lat = _endpoints(
+            feature['geometry']['coordinates'])
 
         segment_data = {
             'geojson_id': feature_id,
             'highway_ref': nh,
             'segment_number': idx + 1,
             'condition': condition,
-            'start_lat': start_coord[1] if len(start_coord) > 1 else 0,
-            'start_lon': start_coord[0] if len(start_coord) > 0 else 0,
-            'end_lat': end_coord[1] if len(end_coord) > 1 else 0,
-            'end_lon': end_coord[0] if len(end_coord) > 0 else 0,
+            'start_lat': start_lat,
+            'start_lon': start_lon,
+            'end_lat': end_lat,
+            'end_lon': end_lon,
             'highway_type': feature['properties'].get('highway', 'N/A'),
             'oneway': feature['properties'].get('oneway', 'no'),
             'lanes': feature['properties'].get('lanes', 'N/A'),
@@ -238,28 +386,22 @@ for nh in all_highway_names:
         }
 
         if has_real_data and idx < num_maha:
-            maha_row = maha_rows.iloc[idx]
             used_real += 1
-            for col in maha_columns:
-                val = maha_row[col]
-                if isinstance(val, float) and math.isnan(val):
-                    segment_data[col] = None
-                elif isinstance(val, bool):
-                    segment_data[col] = bool(val)
-                else:
-                    segment_data[col] = val
+            segment_data.update(real_records[idx])
         else:
             used_synthetic += 1
-            synthetic = generate_synthetic_maha_row(nh, idx + 1)
+            synthetic = synthetic_rows[idx - num_maha]
             for col in maha_columns:
                 segment_data[col] = synthetic[col]
 
         # ── Add surface defect + roughness parameters ──
-        defect_data = generate_surface_defect_data(condition)
-        for col in surface_defect_columns:
-            segment_data[col] = defect_data[col]
+        for col, val, is_int in zip(surface_defect_columns, defect_rows[idx],
+                                    _DEFECT_IS_INT):
+            segment_data[col] = int(val) if is_int else float(val)
 
-        all_road_segments.append(segment_data)
+        csv_writer.writerow(segment_data)
+        json_mapping[nh][str(feature_id)] = build_json_entry(segment_data)
+        total_segments += 1
 
     highway_stats[nh] = {
         'total_segments': len(features),
@@ -271,46 +413,19 @@ for nh in all_highway_names:
     tag = f" (real: {used_real}, synth: {used_synthetic})" if has_real_data else ""
     print(f"  {nh}: {len(features)} segments{tag}")
 
-# ── Create DataFrame ──
-df = pd.DataFrame(all_road_segments)
-
-# Save CSV
-output_file = 'all_highways_segments_conditions.csv'
-df.to_csv(output_file, index=False)
+csv_fh.close()
 print(f"\n--- Output ---")
 print(f"CSV: {output_file}")
-print(f"  Segments: {len(df)} | Columns: {len(df.columns)}")
-
-# Save JSON (organized by highway ref)
-json_mapping = {}
-for nh in all_highway_names:
-    highway_data = df[df['highway_ref'] == nh]
-    json_mapping[nh] = {}
-
-    for _, row in highway_data.iterrows():
-        entry = {
-            'segment_number': int(row['segment_number']),
-            'condition': row['condition'],
-            'coordinates': [[row['start_lon'], row['start_lat']], [row['end_lon'], row['end_lat']]],
-        }
-        for col in maha_columns + surface_defect_columns:
-            val = row.get(col)
-            if val is None or (isinstance(val, float) and math.isnan(val)):
-                entry[col] = None
-            elif isinstance(val, bool):
-                entry[col] = bool(val)
-            elif isinstance(val, (int, float)):
-                try:
-                    entry[col] = val if not math.isnan(val) else None
-                except TypeError:
-                    entry[col] = val
-            else:
-                entry[col] = str(val)
-        json_mapping[nh][str(row['geojson_id'])] = entry
+print(f"  Segments: {total_segments} | Columns: {len(csv_fieldnames)}")
 
+# Save JSON (organized by highway ref, built during the main loop)
 json_output_file = 'all_highways_segments_conditions.json'
-with open(json_output_file, 'w', encoding='utf-8') as f:
-    json.dump(json_mapping, f, indent=2, ensure_ascii=False)
+with open(json_output_file, 'wb') as f:
+    f.write(orjson.dumps(
+        json_mapping,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+        default=str,
+    ))
 print(f"JSON: {json_output_file}")
 
 # Summary CSV
@@ -341,10 +456,10 @@ total_real = sum(s['real_maha_rows'] for s in highway_stats.values())
 total_synth = sum(s['synthetic_rows'] for s in highway_stats.values())
 print(f"\n--- Final Report ---")
 print(f"Total highways: {len(all_highway_names)}")
-print(f"Total segments: {len(df)}")
+print(f"Total segments: {total_segments}")
 print(f"  Real maha.xlsx data: {total_real}")
 print(f"  Synthetic data: {total_synth}")
-print(f"Columns per segment: {len(df.columns)}")
+print(f"Columns per segment: {len(csv_fieldnames)}")
 
 print(f"\nTop 15 highways by segment count:")
 for _, row in summary_df.head(15).iterrows():
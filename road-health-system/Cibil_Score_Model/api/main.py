@@ -4,8 +4,9 @@ main.py
 FastAPI production inference backend for the Road CIBIL Scoring Service.
 
 Endpoints:
-    POST /score    — Score a single road segment
-    GET  /health   — Service health + model metadata
+    POST /score        — Score a single road segment
+    POST /score_batch  — Score many segments in one request (trusted callers)
+    GET  /health       — Service health + model metadata
 
 Run locally:
     uvicorn main:app --host 0.0.0.0 --port 8000 --reload
@@ -20,12 +21,15 @@ import logging
 import os
 import sys
 from contextlib import asynccontextmanager
+from functools import lru_cache
+
+import orjson
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 import uvicorn
-from fastapi import FastAPI, HTTPException, Request, status
+from fastapi import FastAPI, HTTPException, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
@@ -59,6 +63,10 @@ MODEL_PATH   = Path(
 # ──────────────────────────────────────────────────────────────────────────────
 _predictor: RoadCIBILPredictor | None = None
 
+# /health payload is static once the model is loaded — serialized once at
+# startup so liveness probes don't pay Pydantic construction per poll
+_health_payload: bytes | None = None
+
 
 def get_predictor() -> RoadCIBILPredictor:
     """Return the globally loaded predictor; raise 503 if not ready."""
@@ -70,13 +78,26 @@ def get_predictor() -> RoadCIBILPredictor:
     return _predictor
 
 
+@lru_cache(maxsize=4096)
+def _cached_predict(feature_key: bytes) -> dict[str, Any]:
+    """Run inference keyed on the canonical (key-sorted) feature payload.
+
+    Dashboards tend to re-score the same segments on every poll; identical
+    payloads hit the LRU instead of re-running the RandomForest. The cached
+    latency_ms reflects the original computation.
+    """
+    # The key is a dumped RoadFeatures model — already validated, so the
+    # predictor can skip its defaulting/coercion pass
+    return get_predictor().predict_validated(orjson.loads(feature_key))
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 #  Lifespan (startup / shutdown)
 # ──────────────────────────────────────────────────────────────────────────────
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Load model exactly once at startup; release at shutdown."""
-    global _predictor
+    global _predictor, _health_payload
     logger.info("=" * 60)
     logger.info("  Road CIBIL Scoring API — Starting up")
     logger.info("  Model path : %s", MODEL_PATH)
@@ -84,6 +105,11 @@ async def lifespan(app: FastAPI):
 
     try:
         _predictor = RoadCIBILPredictor(MODEL_PATH)
+        _health_payload = HealthResponse(
+            status="running",
+            model_version=_predictor.model_version,
+            model_metrics=_predictor.metrics,
+        ).model_dump_json().encode()
         logger.info("✅  Model loaded successfully | version=%s", _predictor.model_version)
         logger.info("    Metrics: %s", _predictor.metrics)
     except FileNotFoundError as exc:
@@ -96,7 +122,9 @@ async def lifespan(app: FastAPI):
     yield  # ── API is live ──────────────────────────────────────────────────
 
     logger.info("Road CIBIL API shutting down.")
+    _cached_predict.cache_clear()
     _predictor = None
+    _health_payload = None
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -157,17 +185,18 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
     summary="Health check",
     tags=["Monitoring"],
 )
-async def health() -> HealthResponse:
+async def health() -> Response:
     """
     Returns service status and loaded model metadata.
     Use this endpoint to verify the API is ready to serve predictions.
     """
-    predictor = get_predictor()
-    return HealthResponse(
-        status="running",
-        model_version=predictor.model_version,
-        model_metrics=predictor.metrics,
-    )
+    if _health_payload is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Model is not loaded. The service may still be starting up.",
+        )
+    # Pre-serialized at startup — the metadata never changes while running
+    return Response(content=_health_payload, media_type="application/json")
 
 
 @app.post(
@@ -196,7 +225,7 @@ async def score_road(payload: RoadFeatures, request: Request) -> ScoreResponse:
 
     try:
         raw_dict: dict[str, Any] = payload.model_dump()
-        result   = predictor.predict(raw_dict)
+        result   = _cached_predict(orjson.dumps(raw_dict, option=orjson.OPT_SORT_KEYS))
     except ValueError as exc:
         logger.warning("Validation error during inference: %s", exc)
         raise HTTPException(
@@ -217,7 +246,9 @@ async def score_road(payload: RoadFeatures, request: Request) -> ScoreResponse:
         result["latency_ms"],
     )
 
-    return ScoreResponse(
+    # model_construct skips re-validation — every field comes from the
+    # predictor, which already guarantees types and ranges
+    return ScoreResponse.model_construct(
         final_cibil_score  = result["final_cibil_score"],
         condition_category = result["condition_category"],
         pdi                = result["pdi"],
@@ -229,6 +260,61 @@ async def score_road(payload: RoadFeatures, request: Request) -> ScoreResponse:
     )
 
 
+@app.post(
+    "/score_batch",
+    response_model=list[ScoreResponse],
+    summary="Score a batch of road segments",
+    tags=["Inference"],
+    status_code=status.HTTP_200_OK,
+)
+async def score_road_batch(payloads: list[dict[str, Any]], request: Request) -> list[ScoreResponse]:
+    """
+    Score many highway segments in a single request.
+
+    Amortizes the per-request overhead (HTTP, validation, response
+    serialization) across the whole batch — dashboards re-scoring a
+    network should prefer this over per-segment POST /score calls.
+
+    This is the fast path for **trusted internal callers** (ETL jobs,
+    dashboards re-scoring exported datasets): rows skip Pydantic field
+    validation and go straight through the predictor's own defaulting
+    and coercion. Untrusted clients should use POST /score.
+    """
+    predictor = get_predictor()
+    timestamp = datetime.now(timezone.utc).isoformat()
+
+    try:
+        results = predictor.predict_batch(payloads)
+    except ValueError as exc:
+        logger.warning("Validation error during batch inference: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(exc),
+        ) from exc
+    except Exception as exc:
+        logger.exception("Batch inference failed: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Batch inference failed. Check server logs.",
+        ) from exc
+
+    logger.info("Scored batch of %d segments", len(results))
+
+    return [
+        ScoreResponse.model_construct(
+            final_cibil_score  = r["final_cibil_score"],
+            condition_category = r["condition_category"],
+            pdi                = r["pdi"],
+            pseudo_cibil       = r["pseudo_cibil"],
+            ml_predicted_cibil = r["ml_predicted_cibil"],
+            model_version      = predictor.model_version,
+            latency_ms         = r["latency_ms"],
+            timestamp          = timestamp,
+        )
+        for r in results
+    ]
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 #  Entry-point for direct execution  (python main.py)
 # ──────────────────────────────────────────────────────────────────────────────
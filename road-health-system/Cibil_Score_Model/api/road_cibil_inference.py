@@ -18,15 +18,25 @@ Usage:
 from __future__ import annotations
 
 import logging
-import pickle
+import os
 import time
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import warnings
 
+import joblib
 import numpy as np
-import pandas as pd
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Optional: ONNX Runtime executes the exported forest as a fused native
+# graph, skipping sklearn's per-call Python tree-walk overhead
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
 
 logger = logging.getLogger("road_cibil.inference")
 
@@ -50,6 +60,46 @@ _BOOL_COLS = [
 
 _REGION_VALUES = ["rural", "semi-urban", "urban"]  # expected one-hot prefixes
 
+# Domain-safe defaults (mirrors training-time imputation)
+_NUMERIC_DEFAULTS: dict[str, float] = {
+    "avg_daily_traffic": 5000.0,
+    "truck_percentage": 15.0,
+    "peak_hour_traffic": 500.0,
+    "traffic_weight": 5.0,
+    "elevation_m": 200.0,
+    "lane_count": 2.0,
+    "year_constructed": 2010.0,
+    "last_major_rehab_year": 2015.0,
+    "length_km": 1.0,
+    "pci_score": 70.0,
+}
+
+_CAT_DEFAULTS: dict[str, str] = {
+    "surface_type": "bitumen",
+    "slope_category": "flat",
+    "monsoon_rainfall_category": "medium",
+    "terrain_type": "plain",
+    "region_type": "rural",
+}
+
+
+# Frozen (col, value) pairs — tuple iteration skips the dict-view
+# bytecode on every request
+_ORDINAL_ITEMS = tuple(_ORDINAL_MAPS.items())
+_NUMERIC_DEFAULT_ITEMS = tuple(_NUMERIC_DEFAULTS.items())
+_CAT_DEFAULT_ITEMS = tuple(_CAT_DEFAULTS.items())
+
+
+def _num(value: Any, default: float) -> float:
+    """Scalar equivalent of pd.to_numeric(errors='coerce').fillna(default)."""
+    if value is None:
+        return default
+    try:
+        v = float(value)
+    except (TypeError, ValueError):
+        return default
+    return default if v != v else v  # NaN → default
+
 
 class RoadCIBILPredictor:
     """
@@ -67,8 +117,15 @@ class RoadCIBILPredictor:
         logger.info("Loading model artifact from %s …", model_path)
         t0 = time.perf_counter()
 
-        with open(model_path, "rb") as fh:
-            artifact: dict[str, Any] = pickle.load(fh)
+        # Silence sklearn's feature-name UserWarning once — array input is
+        # intentional, and a per-call catch_warnings() context takes the
+        # filters lock on every request
+        warnings.filterwarnings("ignore", category=UserWarning, module="sklearn")
+
+        # joblib memory-maps NumPy buffers (RF tree arrays, scaler vectors)
+        # straight off the page cache instead of copying every byte; it
+        # also transparently reads plain-pickle artifacts from older exports
+        artifact: dict[str, Any] = joblib.load(model_path, mmap_mode="r")
 
         # ── Unpack artifact ────────────────────────────────────────────────
         self._model          = artifact["model"]
@@ -84,6 +141,52 @@ class RoadCIBILPredictor:
         self._model_version  = artifact.get("model_version", "v1.0")
         self._metrics        = artifact.get("metrics", {})
 
+        # n_jobs=None keeps single-row predicts serial (no joblib thread
+        # fan-out) while letting predict_batch widen through a
+        # parallel_backend context without mutating the estimator
+        if hasattr(self._model, "n_jobs"):
+            self._model.n_jobs = None
+
+        # ── Precomputed inference plumbing ────────────────────────────────
+        # The per-request path works on plain dicts and one small feature
+        # vector allocated per call (a shared buffer would break concurrent
+        # predicts); pandas never touches the hot path.
+        self._col_idx = {c: i for i, c in enumerate(self._feature_cols)}
+        self._n_features = len(self._feature_cols)
+
+        # MinMaxScaler.transform is X * scale_ + min_ — keep the two
+        # vectors so scaling is two in-place ufuncs instead of an
+        # estimator call that validates and copies
+        self._scaler_scale = np.ascontiguousarray(self._scaler.scale_, dtype=np.float64)
+        self._scaler_offset = np.ascontiguousarray(self._scaler.min_, dtype=np.float64)
+
+        # PDI weights/ceilings as aligned vectors — the weighted sum becomes
+        # a single clip + dot product instead of a per-column Python loop
+        self._pdi_cols = list(self._pdi_weights.keys())
+        self._pdi_w = np.array(
+            [self._pdi_weights[c] for c in self._pdi_cols], dtype=np.float64
+        )
+        self._pdi_max = np.array(
+            [self._distress_max[c] for c in self._pdi_cols], dtype=np.float64
+        )
+
+        # Condition bins as a sorted array so label lookup is a binary search
+        self._bins_arr = np.asarray(self._condition_bins, dtype=np.float64)
+        self._labels_tuple = tuple(self._condition_lbls)
+
+        # Prefer an ONNX Runtime session when a converted forest sits next
+        # to the pickle (export via skl2onnx at training time); falls back
+        # to the sklearn model otherwise
+        self._onnx_sess = None
+        self._onnx_input = None
+        onnx_path = model_path.with_suffix(".onnx")
+        if ort is not None and onnx_path.exists():
+            self._onnx_sess = ort.InferenceSession(
+                str(onnx_path), providers=["CPUExecutionProvider"]
+            )
+            self._onnx_input = self._onnx_sess.get_inputs()[0].name
+            logger.info("Using ONNX Runtime session from %s", onnx_path)
+
         elapsed = (time.perf_counter() - t0) * 1000
         logger.info(
             "✅  Model loaded in %.1f ms | version=%s | features=%d | R²=%s",
@@ -121,17 +224,31 @@ class RoadCIBILPredictor:
             final_cibil_score, condition_category
         """
         t0 = time.perf_counter()
+        feats = self._handle_missing(raw)
+        return self._score(feats, current_year, t0)
 
-        df = pd.DataFrame([raw])
-        df = self._handle_missing(df)
-        df = self._encode_categoricals(df)
-        df = self._engineer_features(df, current_year)
-        df = self._compute_pdi(df)
+    def predict_validated(
+        self, raw: dict[str, Any], current_year: int = 2026
+    ) -> dict[str, Any]:
+        """
+        Score a payload already validated by the API schema layer.
 
-        pseudo_cibil = float(df["Pseudo_CIBIL"].iloc[0])
-        pdi          = float(df["PDI"].iloc[0])
+        Skips the defaulting/coercion pass entirely — a dumped
+        ``RoadFeatures`` model guarantees every field is present with the
+        right type and range. Use :meth:`predict` for unvalidated input.
+        """
+        t0 = time.perf_counter()
+        return self._score(dict(raw), current_year, t0)
 
-        ml_pred = self._ml_predict(df)
+    def _score(
+        self, feats: dict[str, Any], current_year: int, t0: float
+    ) -> dict[str, Any]:
+        """Shared scoring tail: encode → engineer → PDI → ML → blend."""
+        self._encode_categoricals(feats)
+        self._engineer_features(feats, current_year)
+
+        pdi, pseudo_cibil = self._compute_pdi(feats)
+        ml_pred = self._ml_predict(feats)
 
         final_cibil = round(
             float(np.clip(
@@ -151,131 +268,183 @@ class RoadCIBILPredictor:
             "latency_ms":            latency_ms,
         }
 
+    def predict_batch(
+        self,
+        records: list[dict[str, Any]] | pd.DataFrame,
+        current_year: int = 2026,
+    ) -> list[dict[str, Any]]:
+        """
+        Score many road segments with one scaler + one RF call.
+
+        Amortizes the per-call sklearn overhead across the whole batch:
+        preprocessing runs column-wise, PDI is a single matmul, and
+        ``scaler.transform`` / ``model.predict`` each run exactly once.
+        Output per row is identical to :meth:`predict`.
+        """
+        t0 = time.perf_counter()
+
+        if hasattr(records, "to_dict"):  # pandas DataFrame input
+            records = records.to_dict("records")
+        n = len(records)
+        if n == 0:
+            return []
+
+        feats_rows = [self._handle_missing(raw) for raw in records]
+        for feats in feats_rows:
+            self._encode_categoricals(feats)
+            self._engineer_features(feats, current_year)
+
+        # ── PDI: one clip + matmul over the (N, distress) matrix ─────────
+        D = np.array(
+            [[feats[c] for c in self._pdi_cols] for feats in feats_rows],
+            dtype=np.float64,
+        )
+        # Fused in place: clip → normalise → matmul → scale → clip without
+        # allocating an intermediate per step (D is ours, freshly built)
+        np.clip(D, 0.0, self._pdi_max, out=D)
+        D /= self._pdi_max
+        pdi_raw = D @ self._pdi_w
+        pdi_raw *= 100.0
+        np.clip(pdi_raw, 0.0, 100.0, out=pdi_raw)
+
+        # ── ML: single scaler.transform + model.predict over (N, P) ──────
+        X = np.zeros((n, len(self._feature_cols)), dtype=np.float64)
+        for col, i in self._col_idx.items():
+            X[:, i] = [feats.get(col, 0.0) for feats in feats_rows]
+
+        X *= self._scaler_scale
+        X += self._scaler_offset
+
+        # Fan the forest out over threads only when the batch is big enough
+        # to amortize pool startup; the backend context supplies the wider
+        # n_jobs default without touching shared estimator state, so
+        # concurrent single-row predicts are unaffected
+        if n >= 256 and self._onnx_sess is None \
+                and hasattr(self._model, "n_jobs"):
+            with joblib.parallel_backend("threading", n_jobs=os.cpu_count() or 1):
+                ml_raw = self._run_model(X)
+        else:
+            ml_raw = self._run_model(X)
+        np.clip(ml_raw, 0.0, 100.0, out=ml_raw)
+
+        # Amortized per-row latency (total batch wall time / N)
+        latency_ms = round((time.perf_counter() - t0) * 1000 / n, 2)
+
+        # Final rounding uses builtin round() per row so batch output is
+        # bit-identical to predict()
+        results: list[dict[str, Any]] = []
+        for i in range(n):
+            pdi = round(float(pdi_raw[i]), 2)
+            pseudo_cibil = round(min(max(100.0 - pdi, 0.0), 100.0), 2)
+            ml_pred = round(float(ml_raw[i]), 2)
+            final = round(
+                min(max(self._pseudo_w * pseudo_cibil + self._ml_w * ml_pred,
+                        0.0), 100.0),
+                2,
+            )
+            results.append({
+                "pdi":                pdi,
+                "pseudo_cibil":       pseudo_cibil,
+                "ml_predicted_cibil": ml_pred,
+                "final_cibil_score":  final,
+                "condition_category": self._assign_condition(final),
+                "latency_ms":         latency_ms,
+            })
+        return results
+
     # ── Private helpers ───────────────────────────────────────────────────────
 
-    def _handle_missing(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Fill missing numeric values with domain-safe defaults."""
-        df = df.copy()
+    def _handle_missing(self, raw: dict[str, Any]) -> dict[str, Any]:
+        """Build a feature dict from raw input, filling domain-safe defaults."""
+        feats: dict[str, Any] = {}
+
         # Distress defaults → 0 (no distress observed)
         for col in self._distress_cols:
-            if col not in df.columns:
-                df[col] = 0.0
-            else:
-                df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0.0)
+            feats[col] = _num(raw.get(col), 0.0)
 
         # Numeric structural / traffic defaults
-        numeric_defaults = {
-            "avg_daily_traffic": 5000.0,
-            "truck_percentage": 15.0,
-            "peak_hour_traffic": 500.0,
-            "traffic_weight": 5.0,
-            "elevation_m": 200.0,
-            "lane_count": 2.0,
-            "year_constructed": 2010.0,
-            "last_major_rehab_year": 2015.0,
-            "length_km": 1.0,
-            "pci_score": 70.0,
-        }
-        for col, default in numeric_defaults.items():
-            if col not in df.columns:
-                df[col] = default
-            else:
-                df[col] = pd.to_numeric(df[col], errors="coerce").fillna(default)
-
-        # Categorical defaults
-        cat_defaults = {
-            "surface_type": "bitumen",
-            "slope_category": "flat",
-            "monsoon_rainfall_category": "medium",
-            "terrain_type": "plain",
-            "region_type": "rural",
-        }
-        for col, default in cat_defaults.items():
-            if col not in df.columns:
-                df[col] = default
-            else:
-                df[col] = df[col].fillna(default)
+        for col, default in _NUMERIC_DEFAULT_ITEMS:
+            feats[col] = _num(raw.get(col), default)
+
+        # Categorical defaults — normalized the same way the schema's
+        # normalize_categorical validator does, so unvalidated batch rows
+        # encode identically to /score payloads
+        for col, default in _CAT_DEFAULT_ITEMS:
+            v = raw.get(col)
+            if v is None or (isinstance(v, float) and v != v):
+                v = default
+            elif isinstance(v, str):
+                v = v.lower().strip()
+            feats[col] = v
 
         # Boolean flag defaults → 0
         for col in _BOOL_COLS:
-            if col not in df.columns:
-                df[col] = 0
-            else:
-                df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(int)
+            feats[col] = int(_num(raw.get(col), 0))
+
+        return feats
 
-        return df
+    def _encode_categoricals(self, feats: dict[str, Any]) -> None:
+        """Deterministic ordinal + one-hot encoding (mirrors training).
 
-    def _encode_categoricals(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Deterministic ordinal + one-hot encoding (mirrors training)."""
-        df = df.copy()
-        for col, mapping in _ORDINAL_MAPS.items():
-            if col in df.columns:
-                df[col] = df[col].map(mapping).fillna(2).astype(int)
+        Mutates the feature dict in place.
+        """
+        for col, mapping in _ORDINAL_ITEMS:
+            feats[col] = mapping.get(feats[col], 2)  # fallback = mid
 
         # One-hot region_type
-        if "region_type" in df.columns:
-            region_val = str(df["region_type"].iloc[0]).lower()
-            for rv in _REGION_VALUES:
-                df[f"region_{rv}"] = int(region_val == rv)
-            df.drop(columns=["region_type"], inplace=True)
-        else:
-            for rv in _REGION_VALUES:
-                if f"region_{rv}" not in df.columns:
-                    df[f"region_{rv}"] = 0
+        region_val = str(feats.pop("region_type")).lower().strip()
+        for rv in _REGION_VALUES:
+            feats[f"region_{rv}"] = int(region_val == rv)
+
+    def _engineer_features(self, feats: dict[str, Any], current_year: int) -> None:
+        """Derive time-based and traffic-stress features in place."""
+        feats["road_age"] = max(current_year - feats["year_constructed"], 0)
+        feats["years_since_rehab"] = max(
+            current_year - feats["last_major_rehab_year"], 0
+        )
+        feats["traffic_stress"] = (
+            feats["avg_daily_traffic"] * feats["truck_percentage"] / 100.0
+        )
 
-        for col in _BOOL_COLS:
-            if col in df.columns:
-                df[col] = df[col].astype(int)
-
-        return df
-
-    def _engineer_features(self, df: pd.DataFrame, current_year: int) -> pd.DataFrame:
-        """Derive time-based and traffic-stress features."""
-        df = df.copy()
-        if "year_constructed" in df.columns:
-            df["road_age"] = (current_year - df["year_constructed"]).clip(lower=0)
-        if "last_major_rehab_year" in df.columns:
-            df["years_since_rehab"] = (
-                current_year - df["last_major_rehab_year"]
-            ).clip(lower=0)
-        if "avg_daily_traffic" in df.columns and "truck_percentage" in df.columns:
-            df["traffic_stress"] = (
-                df["avg_daily_traffic"] * df["truck_percentage"] / 100.0
-            )
-        return df
-
-    def _compute_pdi(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Compute PDI and Pseudo_CIBIL using embedded weights and ceilings."""
-        df = df.copy()
-        weighted_sum = pd.Series(np.zeros(len(df)), index=df.index)
-        for col, weight in self._pdi_weights.items():
-            max_val = self._distress_max[col]
-            normalised = (df[col].clip(lower=0, upper=max_val) / max_val).astype(float)
-            weighted_sum += weight * normalised
-
-        df["PDI"]          = (weighted_sum * 100).clip(0, 100).round(2)
-        df["Pseudo_CIBIL"] = (100 - df["PDI"]).clip(0, 100).round(2)
-        return df
-
-    def _ml_predict(self, df: pd.DataFrame) -> float:
-        """Scale features and run RF inference."""
-        # Build feature matrix — fill any missing feature cols with 0
-        X = pd.DataFrame(index=df.index)
-        for col in self._feature_cols:
-            X[col] = df[col] if col in df.columns else 0.0
-
-        X_scaled = self._scaler.transform(X)
-        # Suppress sklearn feature-name warning (array input is intentional)
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", UserWarning)
-            pred = float(self._model.predict(X_scaled)[0])
+    def _compute_pdi(self, feats: dict[str, Any]) -> tuple[float, float]:
+        """Compute (PDI, Pseudo_CIBIL) using embedded weights and ceilings."""
+        vals = np.array([feats[c] for c in self._pdi_cols], dtype=np.float64)
+        norm = np.clip(vals, 0.0, self._pdi_max) / self._pdi_max
+        weighted_sum = float(norm @ self._pdi_w)
+
+        pdi = round(min(max(weighted_sum * 100.0, 0.0), 100.0), 2)
+        pseudo_cibil = round(min(max(100.0 - pdi, 0.0), 100.0), 2)
+        return pdi, pseudo_cibil
+
+    def _ml_predict(self, feats: dict[str, Any]) -> float:
+        """Scale the feature vector and run RF inference."""
+        # Fresh (1, P) vector per call — negligible next to the forest
+        # walk, and concurrent predicts never share a buffer. Missing
+        # feature cols stay 0.
+        X = np.zeros((1, self._n_features), dtype=np.float64)
+        for col, i in self._col_idx.items():
+            v = feats.get(col)
+            if v is not None:
+                X[0, i] = v
+
+        X *= self._scaler_scale
+        X += self._scaler_offset
+        pred = float(self._run_model(X)[0])
         return round(float(np.clip(pred, 0.0, 100.0)), 2)
 
+    def _run_model(self, X_scaled: np.ndarray) -> np.ndarray:
+        """Run the forest on scaled features (ONNX session if available)."""
+        if self._onnx_sess is not None:
+            out = self._onnx_sess.run(
+                None, {self._onnx_input: X_scaled.astype(np.float32)}
+            )[0]
+            return np.asarray(out, dtype=np.float64).ravel()
+
+        return self._model.predict(X_scaled)
+
     def _assign_condition(self, score: float) -> str:
-        """Map final CIBIL score to a condition label."""
-        bins   = self._condition_bins
-        labels = self._condition_lbls
-        for i in range(len(bins) - 1):
-            if bins[i] <= score < bins[i + 1]:
-                return labels[i]
-        return labels[-1]  # score == 100 edge case
+        """Map final CIBIL score to a condition label via binary search."""
+        labels = self._labels_tuple
+        idx = int(np.searchsorted(self._bins_arr, score, side="right")) - 1
+        # Clamp covers both the score == 100 edge case and any underflow
+        return labels[min(max(idx, 0), len(labels) - 1)]
@@ -13,9 +13,9 @@ Every field has:
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -114,23 +114,23 @@ class RoadFeatures(BaseModel):
         default=200.0, ge=0.0, le=8000.0,
         description="Average elevation in metres."
     )
-    surface_type: str = Field(
+    surface_type: Literal["earthen", "gravel", "bitumen", "concrete"] = Field(
         default="bitumen",
         description="Surface type: 'earthen', 'gravel', 'bitumen', or 'concrete'."
     )
-    slope_category: str = Field(
+    slope_category: Literal["flat", "moderate", "steep"] = Field(
         default="flat",
         description="Slope category: 'flat', 'moderate', or 'steep'."
     )
-    monsoon_rainfall_category: str = Field(
+    monsoon_rainfall_category: Literal["low", "medium", "high"] = Field(
         default="medium",
         description="Annual rainfall class: 'low', 'medium', or 'high'."
     )
-    terrain_type: str = Field(
+    terrain_type: Literal["plain", "hilly", "steep"] = Field(
         default="plain",
         description="Terrain type: 'plain', 'hilly', or 'steep'."
     )
-    region_type: str = Field(
+    region_type: Literal["rural", "semi-urban", "urban"] = Field(
         default="rural",
         description="Region class: 'rural', 'semi-urban', or 'urban'."
     )
@@ -155,50 +155,19 @@ class RoadFeatures(BaseModel):
 
     # ── Validators ────────────────────────────────────────────────────────────
 
-    @field_validator("surface_type")
-    @classmethod
-    def validate_surface_type(cls, v: str) -> str:
-        allowed = {"earthen", "gravel", "bitumen", "concrete"}
-        v_lower = v.lower().strip()
-        if v_lower not in allowed:
-            raise ValueError(f"surface_type must be one of {allowed}, got '{v}'")
-        return v_lower
-
-    @field_validator("slope_category")
-    @classmethod
-    def validate_slope_category(cls, v: str) -> str:
-        allowed = {"flat", "moderate", "steep"}
-        v_lower = v.lower().strip()
-        if v_lower not in allowed:
-            raise ValueError(f"slope_category must be one of {allowed}, got '{v}'")
-        return v_lower
-
-    @field_validator("monsoon_rainfall_category")
-    @classmethod
-    def validate_rainfall(cls, v: str) -> str:
-        allowed = {"low", "medium", "high"}
-        v_lower = v.lower().strip()
-        if v_lower not in allowed:
-            raise ValueError(f"monsoon_rainfall_category must be one of {allowed}, got '{v}'")
-        return v_lower
-
-    @field_validator("terrain_type")
-    @classmethod
-    def validate_terrain(cls, v: str) -> str:
-        allowed = {"plain", "hilly", "steep"}
-        v_lower = v.lower().strip()
-        if v_lower not in allowed:
-            raise ValueError(f"terrain_type must be one of {allowed}, got '{v}'")
-        return v_lower
-
-    @field_validator("region_type")
+    @field_validator(
+        "surface_type",
+        "slope_category",
+        "monsoon_rainfall_category",
+        "terrain_type",
+        "region_type",
+        mode="before",
+    )
     @classmethod
-    def validate_region(cls, v: str) -> str:
-        allowed = {"rural", "semi-urban", "urban"}
-        v_lower = v.lower().strip()
-        if v_lower not in allowed:
-            raise ValueError(f"region_type must be one of {allowed}, got '{v}'")
-        return v_lower
+    def normalize_categorical(cls, v: object) -> object:
+        """Lowercase/strip string input; the Literal types enforce the
+        allowed values natively in pydantic-core."""
+        return v.lower().strip() if isinstance(v, str) else v
 
     @model_validator(mode="after")
     def validate_rehab_after_construction(self) -> "RoadFeatures":
@@ -208,8 +177,8 @@ class RoadFeatures(BaseModel):
             )
         return self
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "iri_value": 3.5,
                 "alligator_cracking_pct": 12.0,
@@ -242,6 +211,7 @@ class RoadFeatures(BaseModel):
                 "tourism_route_flag": 0,
             }
         }
+    )
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -260,8 +230,8 @@ class ScoreResponse(BaseModel):
     latency_ms:           float = Field(description="Inference latency in milliseconds.")
     timestamp:            str   = Field(description="ISO-8601 UTC timestamp.")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "final_cibil_score": 72.34,
                 "condition_category": "Fair",
@@ -273,6 +243,7 @@ class ScoreResponse(BaseModel):
                 "timestamp": "2026-02-19T10:30:00.000Z",
             }
         }
+    )
 
 
 class HealthResponse(BaseModel):
@@ -80,9 +80,8 @@ def main() -> None:
     sample = df.sample(10, random_state=42)
 
     latencies = []
-    for i, (_, row) in enumerate(sample.iterrows(), 1):
-        raw = row.to_dict()
-        result = predictor.predict(raw)
+    results = predictor.predict_batch(sample.to_dict("records"))
+    for i, result in enumerate(results, 1):
         assert_valid_score(result, f"Segment #{i}")
         latencies.append(result["latency_ms"])
         print(
@@ -187,11 +186,10 @@ def main() -> None:
     print(f"\n{BOLD}[TEST 5] Score range check — 100 random segments{RESET}")
     big_sample = df.sample(100, random_state=99)
     all_scores = []
-    for _, row in big_sample.iterrows():
-        r = predictor.predict(row.to_dict())
-        all_scores.append(r["final_cibil_score"])
-        assert 0.0 <= r["final_cibil_score"] <= 100.0, \
-            f"Score out of range: {r['final_cibil_score']}"
+    for r in predictor.predict_batch(big_sample.to_dict("records")):
+        score = r["final_cibil_score"]
+        all_scores.append(score)
+        assert 0.0 <= score <= 100.0, f"Score out of range: {score}"
         assert r["pdi"] >= 0.0, f"Negative PDI: {r['pdi']}"
 
     ok(
@@ -203,10 +201,10 @@ def main() -> None:
     # ── Test 6: Latency benchmark ─────────────────────────────────────────────
     print(f"\n{BOLD}[TEST 6] Latency benchmark — 50 consecutive requests{RESET}")
     bench_sample = df.sample(50, random_state=7)
-    bench_lats = []
-    for _, row in bench_sample.iterrows():
-        r = predictor.predict(row.to_dict())
-        bench_lats.append(r["latency_ms"])
+    bench_lats = [
+        r["latency_ms"]
+        for r in predictor.predict_batch(bench_sample.to_dict("records"))
+    ]
 
     avg_bench = sum(bench_lats) / len(bench_lats)
     max_bench = max(bench_lats)